@@ -20,7 +20,7 @@ from .krmdata import KRMdata, KRMorganism, KRMshape
 
 __all__ = ['ScatterModelBase', 'BenchmarkData', 'ReferenceModels',
            'MSSModel', 'PSMSModel', 'DCMModel', 'ESModel', 'PTDWBAModel',
-           'DWBAModel', 'SDWBAModel', 'KAModel', 'KRMModel', 'HPModel',
+           'DWBAModel', 'KAModel', 'KRMModel', 'HPModel',
            'wavenumber', 'wavelength', 'Neumann', 'h1', 'spherical_jnpp', 'prolate_swf',
            'theoretical_Sa', 'KRMdata', 'KRMorganism', 'KRMshape',
            'DWBAorganism', 'DWBAdata', 'JechEtAlData',
@@ -1,8 +1,77 @@
 """Provide ready access to the benchmark data."""
 
 from pathlib import Path
+from functools import cache, cached_property
 import pandas as pd
 
+# Mappings from the column names in the benchmark data files to the names used in
+# ReferenceModels
+_F_RENAME = {'Sphere_WeaklyScattering': 'weakly scattering sphere',
+             'Sphere_Rigid': 'fixed rigid sphere',
+             'Sphere_PressureRelease': 'pressure release sphere',
+             'Sphere_Gas': 'gas filled sphere',
+             'ShellSphere_PressureRelease':
+                 'spherical fluid shell with pressure release interior',
+             'ShellSphere_Gas': 'spherical fluid shell with gas interior',
+             'ShellSphere_WeaklyScattering':
+                 'spherical fluid shell with weakly scattering interior',
+             'Cylinder_Rigid': 'fixed rigid finite cylinder',
+             'Cylinder_PressureRelease': 'pressure release finite cylinder',
+             'Cylinder_Gas': 'gas filled finite cylinder',
+             'Cylinder_WeaklyScattering': 'weakly scattering finite cylinder',
+             'ProlateSpheroid_Rigid': 'fixed rigid prolate spheroid',
+             'ProlateSpheroid_PressureRelease': 'pressure release prolate spheroid',
+             'ProlateSpheroid_Gas': 'gas filled prolate spheroid',
+             'ProlateSpheroid_WeaklyScattering': 'weakly scattering prolate spheroid',
+             'Frequency_kHz': 'frequency (kHz)'}
+
+_A_RENAME = {'Cylinder_Rigid': 'fixed rigid finite cylinder',
+             'Cylinder_PressureRelease': 'pressure release finite cylinder',
+             'Cylinder_Gas': 'gas filled finite cylinder',
+             'Cylinder_WeaklyScattering': 'weakly scattering finite cylinder',
+             'ProlateSpheroid_Rigid': 'fixed rigid prolate spheroid',
+             'ProlateSpheroid_PressureRelease': 'pressure release prolate spheroid',
+             'ProlateSpheroid_Gas': 'gas filled prolate spheroid',
+             'ProlateSpheroid_WeaklyScattering': 'weakly scattering prolate spheroid',
+             'Angle_deg': 'angle (deg)'}
+
+
+_DATA_DIRECTORY = Path(__file__).parent/Path('resources')/Path('BenchMark_Data')
+
+
+# The benchmark files are read at most once per session. BenchmarkData instances get their own
+# copy of the DataFrames so that changes to one do not affect the others.
+@cache
+def _read_angle_dataset() -> pd.DataFrame:
+    """Read the angle benchmark dataset."""
+    df = pd.read_csv(_DATA_DIRECTORY/'Benchmark_Angle_TS.csv', memory_map=True,
+                     dtype='float64')
+
+    # Change the column names to match the reference model names used in ReferenceModels
+    df.columns = [_A_RENAME.get(c, c) for c in df.columns]
+
+    # Remove units from the index name (we have the echoSMs units convention instead)
+    df.set_index('angle (deg)', inplace=True)
+    df.index.name = 'angle'
+    return df
+
+
+@cache
+def _read_freq_dataset() -> pd.DataFrame:
+    """Read the frequency benchmark dataset."""
+    df = pd.read_csv(_DATA_DIRECTORY/'Benchmark_Frequency_TS.csv', memory_map=True,
+                     dtype='float64')
+
+    # Change the column names to match the reference model names used in ReferenceModels
+    df.columns = [_F_RENAME.get(c, c) for c in df.columns]
+
+    df['frequency (kHz)'] *= 1e3  # want Hz not kHz
+
+    # Remove units from the index name (we have the echoSMs units convention instead)
+    df.set_index('frequency (kHz)', inplace=True)
+    df.index.name = 'frequency'
+    return df
+
 
 class BenchmarkData:
     """Convenient interface to the benchmark dataset.
@@ -22,57 +91,19 @@ class BenchmarkData:
     Journal of the Acoustical Society of America 138, 3742-3764. <https://doi.org/10.1121/1.4937607>
     """
 
-    f_rename = {'Sphere_WeaklyScattering': 'weakly scattering sphere',
-                'Sphere_Rigid': 'fixed rigid sphere',
-                'Sphere_PressureRelease': 'pressure release sphere',
-                'Sphere_Gas': 'gas filled sphere',
-                'ShellSphere_PressureRelease':
-                    'spherical fluid shell with pressure release interior',
-                'ShellSphere_Gas': 'spherical fluid shell with gas interior',
-                'ShellSphere_WeaklyScattering':
-                    'spherical fluid shell with weakly scattering interior',
-                'Cylinder_Rigid': 'fixed rigid finite cylinder',
-                'Cylinder_PressureRelease': 'pressure release finite cylinder',
-                'Cylinder_Gas': 'gas filled finite cylinder',
-                'Cylinder_WeaklyScattering': 'weakly scattering finite cylinder',
-                'ProlateSpheroid_Rigid': 'fixed rigid prolate spheroid',
-                'ProlateSpheroid_PressureRelease': 'pressure release prolate spheroid',
-                'ProlateSpheroid_Gas': 'gas filled prolate spheroid',
-                'ProlateSpheroid_WeaklyScattering': 'weakly scattering prolate spheroid',
-                'Frequency_kHz': 'frequency (kHz)'}
-
-    a_rename = {'Cylinder_Rigid': 'fixed rigid finite cylinder',
-                'Cylinder_PressureRelease': 'pressure release finite cylinder',
-                'Cylinder_Gas': 'gas filled finite cylinder',
-                'Cylinder_WeaklyScattering': 'weakly scattering finite cylinder',
-                'ProlateSpheroid_Rigid': 'fixed rigid prolate spheroid',
-                'ProlateSpheroid_PressureRelease': 'pressure release prolate spheroid',
-                'ProlateSpheroid_Gas': 'gas filled prolate spheroid',
-                'ProlateSpheroid_WeaklyScattering': 'weakly scattering prolate spheroid',
-                'Angle_deg': 'angle (deg)'}
-
-    def __init__(self):
-
-        data_directory = Path(__file__).parent/Path('resources')/Path('BenchMark_Data')
-
-        angle_data_file = data_directory/'Benchmark_Angle_TS.csv'
-        freq_data_file = data_directory/'Benchmark_Frequency_TS.csv'
-
-        self.angle_dataset = pd.read_csv(angle_data_file)
-        self.freq_dataset = pd.read_csv(freq_data_file)
-
-        # Change the column names to match the reference model names used in ReferenceModels
-        self.angle_dataset.rename(columns=BenchmarkData.a_rename, inplace=True)
-        self.freq_dataset.rename(columns=BenchmarkData.f_rename, inplace=True)
-
-        self.freq_dataset['frequency (kHz)'] *= 1e3  # want Hz not kHz
-
-        # Remove units from the column names (we have the echoSMs units convention instead)
-        self.freq_dataset.rename(columns={'frequency (kHz)': 'frequency'}, inplace=True)
-        self.angle_dataset.rename(columns={'angle (deg)': 'angle'}, inplace=True)
-
-        self.angle_dataset.set_index('angle', inplace=True)
-        self.freq_dataset.set_index('frequency', inplace=True)
+    # Kept as class attributes for backwards compatibility
+    f_rename = _F_RENAME
+    a_rename = _A_RENAME
+
+    @cached_property
+    def angle_dataset(self) -> pd.DataFrame:
+        """The angle benchmark dataset, read from file on first access."""
+        return _read_angle_dataset().copy()
+
+    @cached_property
+    def freq_dataset(self) -> pd.DataFrame:
+        """The frequency benchmark dataset, read from file on first access."""
+        return _read_freq_dataset().copy()
 
     def angle_names(self) -> list:
         """Provide the model names for the angle benchmark data.
@@ -107,8 +138,9 @@ class BenchmarkData:
         -------
         :
             Tuple containing the frequencies (Hz) and TS (dB) for the requested benchmark model.
+            These are float64 NumPy arrays that share memory with the dataset.
         """
-        if name not in self.freq_names():
+        if name not in self.freq_dataset.columns:
             raise ValueError(f'The requested model ({name}) '
                              'is not in the frequency benchmark dataset.')
         return (self.freq_dataset.index.values, self.freq_dataset[name].values)
@@ -125,8 +157,9 @@ class BenchmarkData:
         -------
         :
             Tuple containing the angles (°) and TS (dB) for the requested benchmark model.
+            These are float64 NumPy arrays that share memory with the dataset.
         """
-        if name not in self.angle_names():
+        if name not in self.angle_dataset.columns:
             raise ValueError(f'The requested model ({name}) is not in the angle benchmark dataset.')
         return (self.angle_dataset.index.values, self.angle_dataset[name].values)
 
@@ -1,7 +1,8 @@
 """A class that provides the model series deformed cylinder scattering model."""
 
-from math import sin, cos, nan, pi, log10, fsum
-from scipy.special import jv, hankel1, jvp, h1vp, yv, yvp
+from math import nan, pi
+from functools import cache
+from scipy.special import jv, yv
 # from mapply.mapply import mapply
 # import swifter
 import numpy as np
@@ -9,6 +10,40 @@ from .utils import Neumann, wavenumber, as_dict
 from .scattermodelbase import ScatterModelBase
 
 
+def _num_modes(Ka):
+    """Number of modes needed for the modal series to converge (Wiscombe, 1980)."""
+    Ka = np.abs(Ka)
+    return np.maximum(8, np.ceil(Ka + 4*Ka**(1/3) + 10)).astype(int)
+
+
+@cache
+def _modes(num_modes: int) -> tuple:
+    """The modes and the mode dependent factors in the modal series terms.
+
+    These only depend on the number of modes, so are cached.
+    """
+    m = np.arange(num_modes)
+    return m, (-1)**m * Neumann(m), 1j**(2*m) * Neumann(m)  # m, (-1)^m*N(m), i^(2m)*N(m)
+
+
+def _bessel(func, num_modes: int, x):
+    """Cylindrical Bessel function and its derivative for orders 0 to num_modes-1.
+
+    `func` is scipy's jv or yv. It is called once, for orders 0 to num_modes, and the derivatives
+    are then given by Z'_m(x) = (Z_(m-1)(x) - Z_(m+1)(x))/2, with Z_(-1) = -Z_1 [1]. This is
+    the same relation that scipy's jvp() and yvp() use, but avoids evaluating Z again.
+
+    The orders are on the last axis of the returned arrays.
+
+    References
+    ----------
+    [1] <https://dlmf.nist.gov/10.6.E1>
+    """
+    z = func(np.arange(num_modes+1), x)
+    z_below = np.concatenate((-z[..., 1:2], z[..., :-2]), axis=-1)  # Z_(m-1)
+    return z[..., :-1], (z_below - z[..., 1:])/2
+
+
 class DCMModel(ScatterModelBase):
     """Modal series deformed cylinder model (DCM).
 
@@ -16,6 +51,8 @@ class DCMModel(ScatterModelBase):
     various boundary conditions.
     """
 
+    _vectorised = True
+
     def __init__(self):
         super().__init__()
         self.long_name = 'deformed cylinder model'
@@ -80,7 +117,8 @@ class DCMModel(ScatterModelBase):
 
         Notes
         -----
-        The class implements the code in Section B.1 of Jech et al. (2015).
+        The class implements the code in Section B.1 of Jech et al. (2015). The modal series is
+        truncated using the criterion of Wiscombe (1980).
 
         References
         ----------
@@ -89,41 +127,86 @@ class DCMModel(ScatterModelBase):
         Comparisons among ten models of acoustic backscattering used in aquatic ecosystem
         research. Journal of the Acoustical Society of America 138, 3742–3764.
         <https://doi.org/10.1121/1.4937607>
+
+        Wiscombe, W.J., 1980. Improved Mie scattering algorithms. Applied Optics 19, 1505–1509.
+        <https://doi.org/10.1364/AO.19.001505>
         """
         if validate_parameters:
             self.validate_parameters(locals())
 
-        if theta == 0.0:
-            return nan
+        # The same code is used for one and many TS values
+        return float(self._calculate_ts_array(medium_c, medium_rho, a, b, theta, f, boundary_type,
+                                              target_c, target_rho)[0])
+
+    def _calculate_ts_array(self, medium_c, medium_rho, a, b, theta, f, boundary_type,
+                            target_c=None, target_rho=None, **kwargs) -> np.ndarray:
+        """Calculate the TS for arrays of parameters.
+
+        The parameters are as per calculate_ts_single(), but can be arrays. They are broadcast
+        against each other and one TS value is returned for each resulting parameter set.
+        """
+        target_c = np.nan if target_c is None else target_c
+        target_rho = np.nan if target_rho is None else target_rho
+
+        boundary_type, *params = np.broadcast_arrays(boundary_type, medium_c, medium_rho, a, b,
+                                                     theta, f, target_c, target_rho)
+        boundary_type = boundary_type.ravel()
+        medium_c, medium_rho, a, b, theta, f, target_c, target_rho =\
+            [np.asarray(v, dtype=float).ravel() for v in params]
 
         theta_rad = theta*pi/180.
-        kL = wavenumber(medium_c, f)*b
-        K = wavenumber(medium_c, f) * sin(theta_rad)
+        k = wavenumber(medium_c, f)
+        kL = k*b
+        K = k*np.sin(theta_rad)
         Ka = K*a
 
-        m = range(30)  # TODO this needs to vary with f
-
-        match boundary_type:
-            case 'fixed rigid':
-                series = map(lambda m: (-1)**m * Neumann(m)*(jvp(m, Ka) / h1vp(m, Ka)), m)
-            case 'pressure release':
-                series = map(lambda m: (-1)**m * Neumann(m)*(jv(m, Ka) / hankel1(m, Ka)), m)
-            case 'fluid filled':
-                g = target_rho/medium_rho
-                h = target_c/medium_c
-                gh = g*h
-                Kda = K/h*a
-
-                def Cm(m):
-                    numer = (jvp(m, Kda)*yv(m, Ka)) / (jv(m, Kda)*jvp(m, Ka))\
-                        - gh*(yvp(m, Ka)/jvp(m, Ka))
-                    denom = (jvp(m, Kda)*jv(m, Ka)) / (jv(m, Kda)*jvp(m, Ka)) - gh
-                    return numer/denom
-
-                series = map(lambda m: 1j**(2*m) * Neumann(m) / (1 + 1j*Cm(m)), m)
-            case _:
-                raise ValueError(f'The {self.long_name} model does not support '
-                                 f'a model type of "{boundary_type}".')
-
-        fbs = 1j*b/pi * (sin(kL*cos(theta_rad)) / (kL*cos(theta_rad))) * sum(series)
-        return 20*log10(abs(fbs))  # ts
+        # The modal series terms are calculated for all parameter sets together, with rows being
+        # the parameter sets and columns the modes.
+        # Each parameter set uses the number of modes that its Ka needs; the columns beyond that
+        # are set to zero.
+        num_modes = _num_modes(Ka)
+        m, sign_neumann, i2m_neumann = _modes(int(num_modes.max(initial=0)))
+        series = np.full((Ka.size, m.size), nan, dtype=complex)
+
+        # theta of 0 gives Ka of 0 and the Bessel functions are then not finite. Those TS values
+        # are set to nan at the end. The modes past a parameter set's number of modes can
+        # overflow, but are set to zero.
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            for bt in np.unique(boundary_type):
+                i = boundary_type == bt
+                # The Hankel function of the first kind is J + iY
+                J, Jp = _bessel(jv, m.size, Ka[i, np.newaxis])
+                Y, Yp = _bessel(yv, m.size, Ka[i, np.newaxis])
+                match bt:
+                    case 'fixed rigid':
+                        series[i] = sign_neumann*(Jp / (Jp + 1j*Yp))
+                    case 'pressure release':
+                        series[i] = sign_neumann*(J / (J + 1j*Y))
+                    case 'fluid filled':
+                        g = (target_rho/medium_rho)[i, np.newaxis]
+                        h = (target_c/medium_c)[i, np.newaxis]
+                        gh = g*h
+                        Kda = K[i, np.newaxis]/h*a[i, np.newaxis]
+                        Jd, Jpd = _bessel(jv, m.size, Kda)
+
+                        numer = (Jpd*Y) / (Jd*Jp) - gh*(Yp/Jp)
+                        denom = (Jpd*J) / (Jd*Jp) - gh
+                        Cm = numer/denom
+
+                        series[i] = i2m_neumann / (1 + 1j*Cm)
+                    case _:
+                        raise ValueError(f'The {self.long_name} model does not support '
+                                         f'a model type of "{bt}".')
+
+            series[m >= num_modes[:, np.newaxis]] = 0.0
+
+            # np.sinc(x/pi) is sin(x)/x, including the limit of 1 at x = 0
+            fbs = 1j*b/pi * np.sinc(kL*np.cos(theta_rad)/pi) * series.sum(axis=1)
+
+            # ts = 20*log10(|fbs|), done in place in the one float64 array
+            ts = np.abs(fbs)
+            np.log10(ts, out=ts)
+            ts *= 20.0
+
+        ts[theta == 0.0] = nan
+        return ts
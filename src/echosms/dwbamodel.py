@@ -2,13 +2,15 @@
 
 from .scattermodelbase import ScatterModelBase
 from .utils import wavenumber, as_dict
-from math import log10, cos, acos, pi, isclose, radians
-from cmath import exp
-from scipy.spatial.transform import Rotation as R
+from math import radians
 import numpy as np
+import pandas as pd
 from scipy.special import j1
 import warnings
 
+# Maximum number of elements in the (parameter set, disc) arrays used in the TS calculations
+_BLOCK_SIZE = 2**20
+
 
 class DWBAModel(ScatterModelBase):
     """Distorted-wave Born approximation (DWBA) scattering models.
@@ -18,7 +20,17 @@ class DWBAModel(ScatterModelBase):
     stochastic DWBA (SDWBA) model.
     """
 
-    def __init__(self):
+    _vectorised = True
+
+    def __init__(self, rng=None):
+        """Initialise.
+
+        Parameters
+        ----------
+        rng : None | int | np.random.Generator
+            The random number generator used for the SDWBA phases, or a seed for one. Use
+            a seed or a seeded generator for reproducible SDWBA results.
+        """
         super().__init__()
         self.long_name = 'distorted-wave Born approximation'
         self.short_name = 'dwba'
@@ -30,7 +42,7 @@ class DWBAModel(ScatterModelBase):
         self.g_range = [0.95, 1.05]
         self.h_range = [0.95, 1.05]
         self.no_expand_parameters = ['a', 'rv_pos', 'rv_tan']
-        self.rng = np.random.default_rng()  # for SDWBA
+        self.rng = np.random.default_rng(rng)  # for SDWBA
 
     def validate_parameters(self, params):
         """Validate the model parameters.
@@ -50,7 +62,10 @@ class DWBAModel(ScatterModelBase):
             warnings.warn('Ratio of target and medium sound speeds (h) are '
                           'outside the DWBA limits.')
 
-        if not np.all([isclose(1.0, np.linalg.norm(v)) for v in p['rv_tan']]):
+        # The squared lengths avoid a sqrt. Their tolerance is twice the math.isclose() default
+        # relative tolerance on the lengths.
+        rv_tan = np.asarray(p['rv_tan'], dtype=float)
+        if not np.allclose(np.einsum('ij,ij->i', rv_tan, rv_tan), 1.0, rtol=0.0, atol=2e-9):
             raise ValueError('All vectors in rv_tan must be of unit length.')
 
     def calculate_ts_single(self, medium_c, medium_rho, theta, phi, f, target_c, target_rho,
@@ -83,14 +98,15 @@ class DWBAModel(ScatterModelBase):
             Density of the fluid inside the target [kg/m³].
         a : iterable
             The radii of the discs that define the target shape [m].
-        rv_pos : iterable[np.ndarray]
-            An interable of vectors of the 3D positions of the centre of each disc that
-            defines the target shape. Each vector should have three values corresponding to
-            the _x_, _y_, and _z_ coordinates [m] of the disc centre.
-        rv_tan : iterable[np.ndarray]
-            An interable of unit vectors of the tangent to the target body axis at
-            the points given in `rv_pos`. Each vector should have three values corresponding to
-            the _x_, _y_, and _z_ components of the tangent vector.
+        rv_pos : np.ndarray | iterable[np.ndarray]
+            The 3D positions of the centre of each disc that defines the target shape, as an
+            array with one row per disc or an iterable of vectors. Each row/vector should have
+            three values corresponding to the _x_, _y_, and _z_ coordinates [m] of the disc
+            centre.
+        rv_tan : np.ndarray | iterable[np.ndarray]
+            Unit vectors of the tangent to the target body axis at the points given in
+            `rv_pos`, in the same form as `rv_pos`. Each row/vector should have three values
+            corresponding to the _x_, _y_, and _z_ components of the tangent vector.
         phase_sd : float
             If non-zero, this model becomes the SDWBA (stochastic DWBA). A random phase is
             applied to each term in the DWBA integral, obtained from a Gaussian distribution
@@ -132,54 +148,142 @@ class DWBAModel(ScatterModelBase):
         if validate_parameters:
             self.validate_parameters(locals())
 
-        do_sdwba = False if phase_sd == 0.0 else True
+        return float(self._calculate_ts_array(medium_c, medium_rho, theta, phi, f, target_c,
+                                              target_rho, a, rv_pos, rv_tan, phase_sd,
+                                              num_runs)[0])
+
+    def _calculate_ts_df(self, data_df, p, multiprocess=False, progress=False) -> pd.Series:
+        """Calculate the TS for each row in a DataFrame.
+
+        See `ScatterModelBase._calculate_ts_df()` for calling details.
+
+        The rows are calculated together only when the target shape (`a`, `rv_pos`, and `rv_tan`)
+        is a non-expandable parameter and hence the same for all rows. Otherwise,
+        calculate_ts_single() is called once per row.
+        """
+        if not {'a', 'rv_pos', 'rv_tan'} <= p.keys():  # target shape varies between rows
+            return self._calculate_ts_rows(data_df, p, multiprocess, progress)
+
+        return super()._calculate_ts_df(data_df, p, multiprocess, progress)
+
+    def _calculate_ts_array(self, medium_c, medium_rho, theta, phi, f, target_c, target_rho,
+                            a, rv_pos, rv_tan, phase_sd=0, num_runs=1, **kwargs) -> np.ndarray:
+        """Calculate the TS for arrays of parameters.
+
+        The parameters are as per calculate_ts_single(). All except `a`, `rv_pos`, and `rv_tan`
+        can be arrays. They are broadcast against each other and one TS value is returned for
+        each resulting parameter set.
+        """
+        a, rv_pos, rv_tan, d_rv_pos = geometry = _disc_geometry(a, rv_pos, rv_tan)
+
+        medium_c, medium_rho, theta, phi, f, target_c, target_rho, phase_sd, num_runs =\
+            [np.ravel(v) for v in np.broadcast_arrays(medium_c, medium_rho, theta, phi, f,
+                                                      target_c, target_rho, phase_sd, num_runs)]
 
         # The structure of this code follows closely the formulae in Stanton et al (1998). Where
-        # relevant, the equation numbers from that paper are given.
+        # relevant, the equation numbers from that paper are given. Parameter sets are rows and
+        # discs are columns, so per parameter set values are column vectors.
 
         k1 = wavenumber(medium_c, f)
-        k2 = wavenumber(target_c, f)
-        kappa_1 = 1.0 / (medium_rho * medium_c**2)  # Eqn (4) for medium
-        kappa_2 = 1.0 / (target_rho * target_c**2)  # Eqn (4) for target
-        gamma_k = (kappa_2 - kappa_1) / kappa_1  # Eqn (2)
-        gamma_rho = (target_rho - medium_rho) / target_rho  # Eqn (3)
-        # Note: the (gamma_k - gamma_rho) term in Eqn (5) can be simplified using g & h to:
-        # 1/gh^2 + 1/g - 2.
-
-        # Calculate the distance between each disc using the disc position vectors. The Euclidean
-        # distance is the L2 norm so use np.norm(). Could also use
-        # scipy.spatial.distance.euclidean(), but that is apparently a lot slower.
-        dist = np.array([np.linalg.norm(r1-r0) for r0, r1 in zip(rv_pos[0:-1], rv_pos[1:])])  # [m]
-
-        # Thickness of each disc based on the distance between discs. The first and last
-        # discs are treated differently.
-        d_rv_pos = np.hstack((dist[0], dist[0:-1]/2 + dist[1:]/2, dist[-1]))  # [m]
-
-        # Calculate direction of incident wave given theta and phi. The echoSMs convention
-        # has the target rotating and the incident vector always being (0,0,1), but for the DWBA
-        # we keep the body stationary and change the incident vector.
-        rot = R.from_euler('ZYX', (0, theta-90, -phi), degrees=True)
-        k_hat_i = rot.apply([0, 0, 1])  # needs to be a unit vector
-        k_i2 = k_hat_i * k2  # incident vector with magnitude equal to wavenumber inside the target
-
-        # This code is a little complex because it does both the DWBA and SDWBA
-        phase_factors = np.ones(len(a))  # for DWBA
-        runs = []
-
-        for run in range(int(num_runs)):  # is only ever 1 run for the DWBA
-            if do_sdwba:
-                phase_factors = np.exp(1j*self.rng.normal(scale=radians(phase_sd), size=len(a)))
-
-            integral = 0.0
-            for a_, r_pos, d_r_pos, r_tan, p in zip(a, rv_pos, d_rv_pos, rv_tan, phase_factors):
-                # The round() is here because sometimes the dot product gets values slightly outside
-                # the [-1, 1] range (due to floating point inaccuracies) and cos will complain.
-                cbeta_tilt = cos(pi/2 - acos(round(k_hat_i @ r_tan, 8)))
-
-                # This is the integral part of Eqn (5) with addition of
-                # Eqn (4) from Demer & Conti (2003) for the SDWBA part
-                integral += (gamma_k-gamma_rho) * exp(2j*(k_i2@r_pos))\
-                    * a_*j1(2*k2*a_*cbeta_tilt) / cbeta_tilt * abs(d_r_pos) * p
-            runs.append(integral)
-
-        return 20*log10(np.mean(abs(k1/4.0*np.array(runs))))
+        k2 = wavenumber(target_c, f)[:, np.newaxis]
+        # The (gamma_k - gamma_rho) term in Eqn (5), with gamma_k and gamma_rho from Eqns (2), (3),
+        # and (4), simplifies using g & h to 1/gh^2 + 1/g - 2.
+        g = target_rho / medium_rho
+        h = target_c / medium_c
+        contrast = (1.0/(g*h*h) + 1.0/g - 2.0)[:, np.newaxis]
+
+        # When all discs have the same radius and tangent (e.g., a straight cylinder), the Bessel
+        # term is the same for all discs and is only calculated once per parameter set.
+        uniform = np.all(a == a[0]) and np.all(rv_tan == rv_tan[0])
+        a_bessel = a[:1] if uniform else a
+
+        # The magnitude of the integral in Eqn (5)
+        integral = np.empty(len(f))
+
+        # The parameter sets are done in blocks to limit the size of the (parameter set, disc)
+        # and (orientation, disc) arrays.
+        block_size = max(1, _BLOCK_SIZE // len(a))
+        for start in range(0, len(f), block_size):
+            s = slice(start, start+block_size)
+
+            # The incident direction terms for each unique orientation in the block and, for each
+            # parameter set, the index into those.
+            angles, o = np.unique(np.column_stack((theta[s], phi[s])), axis=0,
+                                  return_inverse=True)
+            o = o.ravel()
+            pos_proj, cbeta_tilt = _incidence(angles[:, 0], angles[:, 1], geometry)
+            if uniform:
+                cbeta_tilt = cbeta_tilt[:, :1]
+
+            # a*J1(2*k2*a*cos(beta_tilt))/cos(beta_tilt) tends to k2*a^2 as cos(beta_tilt) tends
+            # to 0 (incident wave parallel to the body axis)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                bessel_term = np.where(cbeta_tilt[o] > 0.0,
+                                       a_bessel*j1(2*k2[s]*a_bessel*cbeta_tilt[o]) / cbeta_tilt[o],
+                                       k2[s]*a_bessel**2)
+
+            # This is the integral part of Eqn (5) for each disc, without the SDWBA phase factors
+            terms = contrast[s] * np.exp(2j*k2[s]*pos_proj[o]) * bessel_term * np.abs(d_rv_pos)
+            integral[s] = np.abs(np.sum(terms, axis=1))
+
+            # The integral in Eqn (5) with addition of Eqn (4) from Demer & Conti (2003) for the
+            # SDWBA part. Only the random phase factors differ between the SDWBA runs, so all
+            # runs are calculated together as a matrix-vector product (one row of phase factors
+            # per run). The mean is taken over the runs.
+            for i in np.flatnonzero(phase_sd[s] != 0.0):
+                j = start + i
+                phases = self.rng.standard_normal((int(num_runs[j]), len(a)))
+                phases *= radians(phase_sd[j])
+                phase_factors = np.exp(1j*phases)
+                integral[j] = np.mean(np.abs(phase_factors @ terms[i]))
+
+        return 20*np.log10(k1/4.0*integral)
+
+
+def _disc_geometry(a, rv_pos, rv_tan):
+    """Disc radii, positions, tangents, and thicknesses as arrays with one row per disc."""
+    rv_pos = np.asarray(rv_pos, dtype=float)
+    rv_tan = np.asarray(rv_tan, dtype=float)
+    a = np.asarray(a, dtype=float)
+
+    # Calculate the distance between each disc using the disc position vectors. This is the
+    # Euclidean distance (L2 norm) between successive positions, with the row-wise sums of
+    # squares done by einsum in one pass.
+    d = np.diff(rv_pos, axis=0)
+    dist = np.sqrt(np.einsum('ij,ij->i', d, d))  # [m]
+
+    # Thickness of each disc based on the distance between discs. The first and last
+    # discs are treated differently. The interior values are written straight into the result.
+    d_rv_pos = np.empty(len(dist)+1)  # [m]
+    d_rv_pos[0] = dist[0]
+    d_rv_pos[-1] = dist[-1]
+    np.add(dist[:-1], dist[1:], out=d_rv_pos[1:-1])
+    d_rv_pos[1:-1] *= 0.5
+
+    return a, rv_pos, rv_tan, d_rv_pos
+
+
+def _incidence(theta, phi, geometry):
+    """Projections of the disc positions and tangents onto the incident directions.
+
+    These depend only on the target shape and orientation, not on the frequency or material
+    properties. `theta` and `phi` can be arrays and the returned arrays have one row per
+    orientation and one column per disc.
+    """
+    _, rv_pos, rv_tan, _ = geometry
+
+    # Calculate direction of incident wave given theta and phi. The echoSMs convention
+    # has the target rotating and the incident vector always being (0,0,1), but for the DWBA
+    # we keep the body stationary and change the incident vector. This is (0, 0, 1) rotated by
+    # the intrinsic ZYX Euler angles (0, theta-90, -phi), written out in closed form.
+    theta_rad = np.radians(theta)
+    phi_rad = np.radians(phi)
+    k_hat_i = np.column_stack((-np.cos(theta_rad)*np.cos(phi_rad), np.sin(phi_rad),
+                               np.sin(theta_rad)*np.cos(phi_rad)))  # unit vectors, one per row
+
+    # cos(beta_tilt) = cos(pi/2 - acos(k_hat_i . r_tan)) = sqrt(1 - (k_hat_i . r_tan)^2). The
+    # clip is because the dot product can be slightly outside [-1, 1] due to floating point
+    # inaccuracies.
+    cbeta_tilt = np.sqrt(np.clip(1.0 - (k_hat_i @ rv_tan.T)**2, 0.0, None))
+
+    return k_hat_i @ rv_pos.T, cbeta_tilt
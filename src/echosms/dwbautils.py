@@ -3,6 +3,8 @@ import numpy as np
 from pathlib import Path
 import sys
 from dataclasses import dataclass
+from functools import cache
+from copy import deepcopy
 from scipy.interpolate import splprep, splev
 if sys.version_info >= (3, 11):
     import tomllib
@@ -31,26 +33,33 @@ def create_dwba_spheroid(major_radius: float, minor_radius: float, spacing: floa
 
     Returns
     -------
-    rv_pos : iterable[np.ndarray]
-        An interable of vectors of the 3D positions of the centre of each disc that
-        defines the spheroid. Each vector has three values corresponding to
-        the _x_, _y_, and _z_ coordinates [m] of the disc centre.
-    rv_tan : iterable[np.ndarray]
-        An interable of unit vectors of the tangent to the target body axis at
-        the points given in `rv_pos`. Each vector has three values corresponding to
-        the _x_, _y_, and _z_ components of the tangent vector.
-    a : iterable
+    rv_pos : np.ndarray
+        The 3D positions of the centre of each disc that defines the spheroid, with one row per
+        disc. Each row has three values corresponding to the _x_, _y_, and _z_ coordinates [m]
+        of the disc centre.
+    rv_tan : np.ndarray
+        Unit vectors of the tangent to the target body axis at the points given in `rv_pos`,
+        with one row per disc. Each row has three values corresponding to the _x_, _y_, and _z_
+        components of the tangent vector.
+    a : np.ndarray
         The radii [m] of the discs that define the spheroid.
     """
-    v = np.linspace(0, np.pi, int(round(2*major_radius/spacing)))
-    a = minor_radius*np.sin(v)  # radius at points along the spheroid
-    x = major_radius-major_radius*np.cos(v)  # shift so that origin is at one end
-
-    # List of disc position vectors
-    rv_pos = [np.array([i, 0, 0]) for i in x]
-
-    # List of tangent vectors to sphere axis (all the same for spheroids)
-    rv_tan = [np.array([1, 0, 0])] * len(x)
+    # One more point than intervals, and always at least the two end points
+    v = np.linspace(0, np.pi, max(2, int(round(2*major_radius/spacing)) + 1))
+    # The scaling and shifting are done in place to avoid temporary arrays
+    a = np.sin(v)
+    a *= minor_radius  # radius at points along the spheroid
+    x = np.cos(v)
+    x *= -major_radius
+    x += major_radius  # shift so that origin is at one end
+
+    # Disc position vectors, one row per disc, all on the x-axis
+    rv_pos = np.zeros((len(x), 3))
+    rv_pos[:, 0] = x
+
+    # Tangent vectors to sphere axis (all the same for spheroids)
+    rv_tan = np.zeros((len(x), 3))
+    rv_tan[:, 0] = 1.0
 
     return rv_pos, rv_tan, a
 
@@ -71,21 +80,25 @@ def create_dwba_cylinder(radius: float, length: float, spacing: float = 0.0001):
 
     Returns
     -------
-    rv_pos : iterable[np.ndarray]
-        An interable of vectors of the 3D positions of the centre of each disc that
-        defines the cylinder. Each vector has three values corresponding to
-        the _x_, _y_, and _z_ coordinates [m] of the disc centre.
-    rv_tan : iterable[np.ndarray]
-        An interable of unit vectors of the tangent to the cylinder body axis at
-        the points given in `rv_pos`. Each vector has three values corresponding to
-        the _x_, _y_, and _z_ components of the tangent vector.
-    a : iterable
-        The radii [m] of the discs that define the spheroid.
+    rv_pos : np.ndarray
+        The 3D positions of the centre of each disc that defines the cylinder, with one row per
+        disc. Each row has three values corresponding to the _x_, _y_, and _z_ coordinates [m]
+        of the disc centre.
+    rv_tan : np.ndarray
+        Unit vectors of the tangent to the cylinder body axis at the points given in `rv_pos`,
+        with one row per disc. Each row has three values corresponding to the _x_, _y_, and _z_
+        components of the tangent vector.
+    a : np.ndarray
+        The radii [m] of the discs that define the cylinder.
     """
-    pos = np.linspace(0, length, int(round(length/spacing)))
-    rv_pos = [np.array([x, 0, 0]) for x in pos]
-    rv_tan = [np.array([1, 0, 0])] * len(pos)
-    a = [radius] * len(pos)
+    # One more point than intervals, and always at least the two end points, so that the
+    # actual spacing is as close as possible to `spacing`.
+    pos = np.linspace(0, length, max(2, int(round(length/spacing)) + 1))
+    rv_pos = np.zeros((len(pos), 3))
+    rv_pos[:, 0] = pos
+    rv_tan = np.zeros((len(pos), 3))
+    rv_tan[:, 0] = 1.0
+    a = np.full(len(pos), float(radius))
 
     return rv_pos, rv_tan, a
 
@@ -133,15 +146,16 @@ class DWBAorganism():
         import matplotlib.pyplot as plt
         fig, axs = plt.subplots(2, 1)
         x = self.rv_pos[:, 0]*1e3
+        # Both outline lines are drawn in one plot() call, one column per line
+        outline = np.column_stack((self.a/2, -self.a/2))
+
         axs[0].plot(x, -self.rv_pos[:, 1]*1e3, '.-', c='C0')
-        axs[0].plot(x, (-self.rv_pos[:, 1]+self.a/2)*1e3, c='C1')
-        axs[0].plot(x, (-self.rv_pos[:, 1]-self.a/2)*1e3, c='C1')
+        axs[0].plot(x, (-self.rv_pos[:, 1, np.newaxis]+outline)*1e3, c='C1')
         axs[0].set_title('Dorsal', loc='left', fontsize=8)
         axs[0].set_aspect('equal')
 
         axs[1].plot(x, -self.rv_pos[:, 2]*1e3, '.-', c='C0')
-        axs[1].plot(x, (-self.rv_pos[:, 2]+self.a/2)*1e3, c='C1')
-        axs[1].plot(x, (-self.rv_pos[:, 2]-self.a/2)*1e3, c='C1')
+        axs[1].plot(x, (-self.rv_pos[:, 2, np.newaxis]+outline)*1e3, c='C1')
         axs[1].set_title('Lateral', loc='left', fontsize=8)
         axs[1].set_aspect('equal')
 
@@ -149,34 +163,52 @@ class DWBAorganism():
         plt.show()
 
 
-class DWBAdata():
-    """Example datasets for the SDWBA and DWBA models."""
+_SHAPES_FILE = Path(__file__).parent/Path('resources')/Path('DWBA_shapes.toml')
 
-    def __init__(self):
-        # Load in the shapes data
-        self.file = Path(__file__).parent/Path('resources')/Path('DWBA_shapes.toml')
-        with open(self.file, 'rb') as f:
-            try:
-                shapes = tomllib.load(f)
-            except tomllib.TOMLDecodeError as e:
-                raise SyntaxError(f'Error while parsing file "{self.defs_filename.name}"') from e
-
-        # Put the shapes into a dict of SDWBAorganism().
-        self.dwba_models = {}
-        for s in shapes['shape']:
+
+# The shapes file is read and processed at most once per session. DWBAdata instances get their
+# own copy of the shapes so that changes to one do not affect the others.
+@cache
+def _load_shapes() -> dict:
+    """Read the DWBA shapes file into a dict of DWBAorganism."""
+    with open(_SHAPES_FILE, 'rb') as f:
+        try:
+            shapes = tomllib.load(f)
+        except tomllib.TOMLDecodeError as e:
+            raise SyntaxError(f'Error while parsing file "{_SHAPES_FILE.name}"') from e
+
+    # Put the shapes into a dict of SDWBAorganism().
+    dwba_models = {}
+    for s in shapes['shape']:
+        # Convert the x, y, z lists into a 2D array with one row for each (x,y,z) point
+        rv_pos = np.vstack((np.array(s['x']), np.array(s['y']), np.array(s['z']))).T
+
+        if np.all(rv_pos[:, 1:] == rv_pos[0, 1:]):
+            # A straight body axis along x, so the tangents are along x too
+            rv_tan = np.zeros_like(rv_pos)
+            rv_tan[:, 0] = np.sign(np.gradient(rv_pos[:, 0]))
+        else:
             # Estimate rv_tan from a spline through (x,y,z).
             tck, u = splprep([s['x'], s['y'], s['z']])
             rv_tan = np.vstack(splev(u, tck, der=1))
-            # Make sure rv_tan holds only unit vectors
-            n = np.linalg.norm(np.vstack(rv_tan), axis=0)
-            rv_tan = (rv_tan / n).T
+            # Make sure rv_tan holds only unit vectors, with one row per point
+            rv_tan /= np.linalg.norm(rv_tan, axis=0)
+            rv_tan = np.ascontiguousarray(rv_tan.T)
+
+        organism = DWBAorganism(rv_pos, np.array(s['a']), np.array(s['g']), np.array(s['h']),
+                                s['name'], s.get('source', ''), s.get('note', ''), rv_tan)
+        dwba_models[s['name']] = organism
+
+    return dwba_models
 
-            # Convert the x, y, z lists into a 2D array with one row for each (x,y,z) point
-            rv_pos = np.vstack((np.array(s['x']), np.array(s['y']), np.array(s['z']))).T
 
-            organism = DWBAorganism(rv_pos, np.array(s['a']), np.array(s['g']), np.array(s['h']),
-                                    s['name'], s.get('source', ''), s.get('note', ''), rv_tan)
-            self.dwba_models[s['name']] = organism
+class DWBAdata():
+    """Example datasets for the SDWBA and DWBA models."""
+
+    def __init__(self):
+        # Load in the shapes data
+        self.file = _SHAPES_FILE
+        self.dwba_models = deepcopy(_load_shapes())
 
     def names(self):
         """Available DWBA model names."""
@@ -1,10 +1,9 @@
 """A class that provides the elastic scattering model."""
 
-from math import log10, sin, atan, fsum
-from cmath import exp
 from warnings import warn
+import numpy as np
 from scipy.special import spherical_jn, spherical_yn
-from .utils import wavenumber, spherical_jnpp, as_dict
+from .utils import wavenumber, _spherical_bessel_derivatives, as_dict
 from .scattermodelbase import ScatterModelBase
 
 
@@ -14,6 +13,8 @@ class ESModel(ScatterModelBase):
     This class calculates acoustic backscatter from elastic spheres.
     """
 
+    _vectorised = True
+
     def __init__(self):
         super().__init__()
         self.long_name = 'elastic sphere'
@@ -78,36 +79,71 @@ class ESModel(ScatterModelBase):
         if validate_parameters:
             self.validate_parameters(locals())
 
-        q = wavenumber(medium_c, f)*a
-        q1 = q*medium_c/target_longitudinal_c
-        q2 = q*medium_c/target_transverse_c
-        alpha = 2. * (target_rho/medium_rho) * (target_transverse_c/medium_c)**2
-        beta = (target_rho/medium_rho) * (target_longitudinal_c/medium_c)**2 - alpha
-
-        # Use n instead of l (ell) because l looks like 1.
-        def S(n):
-            A2 = (n**2 + n-2) * spherical_jn(n, q2) + q2**2 * spherical_jnpp(n, q2)
-            A1 = 2*n*(n+1) * (q1*spherical_jn(n, q1, True) - spherical_jn(n, q1))
-            B2 = A2*q1**2 * (beta*spherical_jn(n, q1) - alpha*spherical_jnpp(n, q1))\
-                - A1*alpha * (spherical_jn(n, q2) - q2*spherical_jn(n, q2, True))
-            B1 = q * (A2*q1*spherical_jn(n, q1, True) - A1*spherical_jn(n, q2))
-            eta_n = atan(-(B2*spherical_jn(n, q, True) - B1*spherical_jn(n, q))
-                         / (B2*spherical_yn(n, q, True) - B1*spherical_yn(n, q)))
-
-            return (-1)**n * (2*n+1) * sin(eta_n) * exp(1j*eta_n)
-
-        # Estimate the number of terms to use in the summation
-        n_max = round(q+10)
-        tol = 1e-10  # somewhat arbitrary
-        while abs(S(n_max)) > tol:
-            n_max += 10
+        return float(self._calculate_ts_array(medium_c, medium_rho, a, f, target_longitudinal_c,
+                                              target_transverse_c, target_rho)[0])
+
+    def _calculate_ts_array(self, medium_c, medium_rho, a, f, target_longitudinal_c,
+                            target_transverse_c, target_rho, **kwargs) -> np.ndarray:
+        """Calculate the TS for arrays of parameters.
 
-        if n_max > 200:
+        The parameters are as per calculate_ts_single(), but can be arrays. They are broadcast
+        against each other and one TS value is returned for each resulting parameter set.
+        """
+        medium_c, medium_rho, a, f, target_longitudinal_c, target_transverse_c, target_rho =\
+            [np.ravel(v) for v in np.broadcast_arrays(medium_c, medium_rho, a, f,
+                                                      target_longitudinal_c,
+                                                      target_transverse_c, target_rho)]
+
+        # Parameter sets are rows and the modal series orders are columns, so per parameter set
+        # values are column vectors.
+        q = (wavenumber(medium_c, f)*a)[:, np.newaxis]
+        q1 = q*(medium_c/target_longitudinal_c)[:, np.newaxis]
+        q2 = q*(medium_c/target_transverse_c)[:, np.newaxis]
+        alpha = (2. * (target_rho/medium_rho) * (target_transverse_c/medium_c)**2)[:, np.newaxis]
+        beta = ((target_rho/medium_rho) * (target_longitudinal_c/medium_c)**2)[:, np.newaxis]\
+            - alpha
+
+        # Estimate the number of terms to use in the summation for each parameter set
+        n_max = np.round(q+10).astype(int)
+        tol = 1e-10  # somewhat arbitrary
+        # Only the parameter sets whose series have not yet converged are checked again
+        i = np.arange(n_max.shape[0])
+        while i.size > 0:
+            term = _series_terms(n_max[i], q[i], q1[i], q2[i], alpha[i], beta[i])
+            i = i[np.abs(term[:, 0]) > tol]
+            n_max[i] += 10
+
+        if np.max(n_max) > 200:
             warn('TS results may be inaccurate because the modal series required a large '
-                 f'number ({n_max}) of terms to converge.')
+                 f'number ({np.max(n_max)}) of terms to converge.')
 
-        n = range(n_max)
+        # All parameter sets use the same orders (as many as the largest n_max in this call), with
+        # the terms past each one's n_max set to zero. Those terms can overflow, hence the
+        # errstate.
+        n = np.arange(np.max(n_max))
+        with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+            terms = np.where(n < n_max, _series_terms(n, q, q1, q2, alpha, beta), 0.0)
 
-        f_inf = -2.0/q * sum(map(S, n))
+        f_inf = -2.0/q[:, 0] * np.sum(terms, axis=1)
 
-        return 10*log10(a**2 * abs(f_inf)**2 / 4.0)
+        return 10*np.log10(a**2 * np.abs(f_inf)**2 / 4.0)
+
+
+def _series_terms(n, q, q1, q2, alpha, beta):
+    """Terms in the modal series for the elastic sphere.
+
+    n can be an array of orders, in which case the terms for all of them are calculated at once.
+    """
+    # Use n instead of l (ell) because l looks like 1.
+    j_q, jp_q, _ = _spherical_bessel_derivatives(spherical_jn, n, q)
+    y_q, yp_q, _ = _spherical_bessel_derivatives(spherical_yn, n, q)
+    j_q1, jp_q1, jpp_q1 = _spherical_bessel_derivatives(spherical_jn, n, q1)
+    j_q2, jp_q2, jpp_q2 = _spherical_bessel_derivatives(spherical_jn, n, q2)
+
+    A2 = (n**2 + n-2) * j_q2 + q2**2 * jpp_q2
+    A1 = 2*n*(n+1) * (q1*jp_q1 - j_q1)
+    B2 = A2*q1**2 * (beta*j_q1 - alpha*jpp_q1) - A1*alpha * (j_q2 - q2*jp_q2)
+    B1 = q * (A2*q1*jp_q1 - A1*j_q2)
+    eta_n = np.arctan(-(B2*jp_q - B1*j_q) / (B2*yp_q - B1*y_q))
+
+    return (-1)**n * (2*n+1) * np.sin(eta_n) * np.exp(1j*eta_n)
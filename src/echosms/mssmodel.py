@@ -111,13 +111,14 @@ class MSSModel(ScatterModelBase):
 
         k0 = wavenumber(medium_c, f)
         ka = k0*a
+        # All orders are calculated in one go as the scipy Bessel functions accept arrays
         n = np.arange(0, round(ka+20))
 
         match boundary_type:
             case 'fixed rigid':
-                A = list(map(lambda x: -spherical_jn(x, ka, True) / h1(x, ka, True), n))
+                A = -spherical_jn(n, ka, True) / h1(n, ka, True)
             case 'pressure release':
-                A = list(map(lambda x: -spherical_jn(x, ka) / h1(x, ka), n))
+                A = -spherical_jn(n, ka) / h1(n, ka)
             case 'fluid filled':
                 k1a = wavenumber(target_c, f)*a
                 gh = target_rho/medium_rho * target_c/medium_c
@@ -130,7 +131,7 @@ class MSSModel(ScatterModelBase):
                         / ((spherical_jn(n, k1a, True)*spherical_jn(n, ka))
                            / (spherical_jn(n, k1a)*spherical_jn(n, ka, True))-gh)
 
-                A = -1/(1 + 1j*np.asarray(list(map(Cn_fr, n)), dtype=complex))
+                A = -1/(1 + 1j*Cn_fr(n))
             case 'fluid shell fluid interior':
                 b = a - shell_thickness
 
@@ -149,7 +150,7 @@ class MSSModel(ScatterModelBase):
                     return (b1*a22*a33 + a13*b2*a32 - a12*b2*a33 - b1*a23*a32)\
                         / (a11*a22*a33 + a13*a21*a32 - a12*a21*a33 - a11*a23*a32)
 
-                A = list(map(Cn_fsfi, n))
+                A = Cn_fsfi(n)
             case 'fluid shell pressure release interior':
                 b = a - shell_thickness
 
@@ -164,7 +165,7 @@ class MSSModel(ScatterModelBase):
                     (b1, b2, d1, d2, a11, a21) = MSSModel.__eqn10(n, k1a, g21, h21, ksa, k2*a, k2*b)
                     return (b1*d2-d1*b2) / (a11*d2-d1*a21)
 
-                A = list(map(Cn_fspri, n))
+                A = Cn_fspri(n)
             case _:
                 raise ValueError(f'The {self.long_name} model does not support '
                                  f'a model type of "{boundary_type}".')
@@ -7,6 +7,9 @@ import numpy as np
 from tqdm import tqdm
 from .utils import as_dataframe
 
+# The maximum number of rows that are given to a model's _calculate_ts_array() at once
+_BLOCK_ROWS = 1000
+
 
 class ScatterModelBase(abc.ABC):
     """Base class for a class that provides a scattering model.
@@ -15,6 +18,10 @@ class ScatterModelBase(abc.ABC):
     ends with 'Model', and provide initialisation and calculate_ts_single() functions.
     """
 
+    # Models that calculate the TS for many rows at once set this to True and provide
+    # _calculate_ts_array().
+    _vectorised = False
+
     @abc.abstractmethod
     def __init__(self):
         """Initialise.
@@ -80,7 +87,9 @@ class ScatterModelBase(abc.ABC):
             [mapply](https://github.com/ddelange/mapply). For more
             sophisticated uses it may be preferred to use a multiprocessing package of your choice
             directly on the `calculate_ts_single()` method. See the code in this method
-            (`calculate_ts()`) for an example.
+            (`calculate_ts()`) for an example. Models that calculate many TS values at once
+            (e.g., [`DCMModel`][echosms.DCMModel]) split blocks of model runs, rather than
+            individual model runs, across the CPU cores.
 
         expand : bool
             Only applicable if `data` is a dict. If `True`, will use
@@ -94,7 +103,9 @@ class ScatterModelBase(abc.ABC):
             already exists, it is overwritten.
 
         progress : bool
-            If `True`, will produce a progress bar while running models
+            If `True`, will produce a progress bar while running models. Models that calculate
+            many TS values at once update the progress bar after each block of model runs, so
+            the progress bar may only update once for small calculations.
 
         Returns
         -------
@@ -127,20 +138,7 @@ class ScatterModelBase(abc.ABC):
         # Get the non-expandable model parameters
         p = data_df.attrs['parameters'] if 'parameters' in data_df.attrs else {}
 
-        # Note: the args argument in the apply call below requires a tuple. data_df.attrs is a
-        # dict and the default behaviour is to make a tuple using the dict keys. The trailing comma
-        # and parenthesis instead causes the tuple to have one entry of the dict.
-
-        if multiprocess:
-            from mapply.mapply import mapply
-            ts = mapply(data_df, self.__ts_helper, args=(p,), axis=1, progressbar=progress)
-        else:  # this uses just one CPU
-            if progress:
-                tqdm.pandas(desc=self.short_name, unit=' models',
-                            bar_format='{l_bar}{bar} [{n_fmt}/{total_fmt}; {rate_noinv_fmt}]')
-                ts = data_df.progress_apply(self.__ts_helper, args=(p,), axis=1)
-            else:
-                ts = data_df.apply(self.__ts_helper, args=(p,), axis=1)
+        ts = self._calculate_ts_df(data_df, p, multiprocess, progress)
 
         match data:
             case dict() if expand:
@@ -160,6 +158,99 @@ class ScatterModelBase(abc.ABC):
                 raise AssertionError('This code should never be reached - unsupported input data '
                                      f'type of {type(data)}.')
 
+    def _calculate_ts_df(self, data_df: pd.DataFrame, p: dict, multiprocess=False,
+                         progress=False) -> pd.Series:
+        """Calculate the TS for each row in a DataFrame.
+
+        Models that set `_vectorised` to `True` have the TS for many rows calculated at once by
+        their `_calculate_ts_array()` method, with the rows given to it in blocks of `_BLOCK_ROWS`
+        so that memory use does not grow with the number of rows. Otherwise,
+        calculate_ts_single() is called once per row.
+
+        Parameters
+        ----------
+        data_df :
+            Model parameters, one set per row.
+        p :
+            Non-expandable model parameters (the same for all rows).
+        multiprocess :
+            Split the ts calculation across CPU cores.
+        progress :
+            Produce a progress bar while running models.
+
+        Returns
+        -------
+        :
+            The TS values, with the same index as `data_df`.
+        """
+        if self._vectorised:
+            return self._calculate_ts_blocks(data_df, p, multiprocess, progress)
+
+        return self._calculate_ts_rows(data_df, p, multiprocess, progress)
+
+    def _calculate_ts_blocks(self, data_df: pd.DataFrame, p: dict, multiprocess=False,
+                             progress=False) -> pd.Series:
+        """Calculate the TS for blocks of rows in a DataFrame by calling _calculate_ts_array().
+
+        See `_calculate_ts_df()` for calling details.
+        """
+        columns = {name: data_df[name].to_numpy() for name in data_df.columns}
+        blocks = [{name: v[start:start+_BLOCK_ROWS] for name, v in columns.items()}
+                  for start in range(0, len(data_df), _BLOCK_ROWS)]
+
+        if multiprocess:
+            # Each block is one item for mapply, so the blocks are split across the CPUs
+            from mapply.mapply import mapply
+            ts = mapply(pd.Series(blocks, dtype=object), self.__ts_block_helper, args=(p,),
+                        chunk_size=1, progressbar=progress).to_list()
+        else:
+            ts = []
+            with tqdm(total=len(data_df), disable=not progress, desc=self.short_name,
+                      unit=' models',
+                      bar_format='{l_bar}{bar} [{n_fmt}/{total_fmt}; {rate_noinv_fmt}]') as bar:
+                for block in blocks:
+                    ts.append(self._calculate_ts_array(**(block | p)))
+                    bar.update(len(ts[-1]))
+
+        return pd.Series(np.concatenate(ts) if ts else [], index=data_df.index, dtype=float)
+
+    def __ts_block_helper(self, block, p):
+        """Call _calculate_ts_array() on a block of rows."""
+        return self._calculate_ts_array(**(block | p))
+
+    def _calculate_ts_array(self, **kwargs):
+        """Calculate the TS for many sets of model parameters at once.
+
+        Models that set `_vectorised` to `True` must provide this. It takes the same parameters
+        as calculate_ts_single(), but with the expandable parameters as arrays (one value per
+        row), and returns an array of TS values.
+        """
+        raise NotImplementedError
+
+    def _calculate_ts_rows(self, data_df: pd.DataFrame, p: dict, multiprocess=False,
+                           progress=False) -> pd.Series:
+        """Calculate the TS for each row in a DataFrame by calling calculate_ts_single().
+
+        See `_calculate_ts_df()` for calling details.
+        """
+        # Note: the args argument in the mapply call below requires a tuple. data_df.attrs is a
+        # dict and the default behaviour is to make a tuple using the dict keys. The trailing comma
+        # and parenthesis instead causes the tuple to have one entry of the dict.
+
+        if multiprocess:
+            from mapply.mapply import mapply
+            return mapply(data_df, self.__ts_helper, args=(p,), axis=1, progressbar=progress)
+
+        # this uses just one CPU. Converting the DataFrame to a list of dicts in one go is much
+        # quicker than having DataFrame.apply() create a Series for each row.
+        rows = data_df.to_dict('records')
+        if progress:
+            rows = tqdm(rows, desc=self.short_name, unit=' models',
+                        bar_format='{l_bar}{bar} [{n_fmt}/{total_fmt}; {rate_noinv_fmt}]')
+
+        ts = [self.calculate_ts_single(**(row | p), validate_parameters=False) for row in rows]
+        return pd.Series(ts, index=data_df.index, dtype=float)
+
     def __ts_helper(self, *args):
         """Convert function arguments and call calculate_ts_single()."""
         p = args[0].to_dict()  # so we can use it for keyword arguments
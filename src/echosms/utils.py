@@ -55,19 +55,21 @@ def theoretical_Sa(ts: float | np.ndarray, eba: float, r: float, nautical=False)
     return ts - eba - 20.0*np.log10(r) + factor
 
 
-def Neumann(m: int) -> int:
+def Neumann(m: int | np.ndarray) -> int | np.ndarray:
     """Neumann number.
 
     Parameters
     ----------
     m :
-        The input integer.
+        The input integer. Can be an array of integers, in which case an array is returned.
 
     Returns
     -------
     :
         The Neumann number.
     """
+    if not np.isscalar(m):
+        return np.where(np.asarray(m) == 0, 1, 2)
     if m == 0:
         return 1
     return 2
@@ -111,13 +113,13 @@ def wavelength(c: float, f: float) -> float:
     return c/f
 
 
-def h1(n: int, z: float, derivative=False) -> complex:
+def h1(n: int | np.ndarray, z: float, derivative=False) -> complex | np.ndarray:
     """Spherical Hankel function of the first kind or its' derivative.
 
     Parameters
     ----------
     n :
-        Order (n ≥ 0).
+        Order (n ≥ 0). Can be an array of orders, in which case an array of values is returned.
     z :
         Argument of the Hankel function.
     derivative :
@@ -145,7 +147,7 @@ def h1(n: int, z: float, derivative=False) -> complex:
 
     [2] <https://dlmf.nist.gov/10.51.E2>
     """
-    if n < 0:
+    if np.any(np.asarray(n) < 0):
         raise ValueError('Negative n values are not supported for spherical Hankel functions.')
 
     if not derivative:
@@ -172,6 +174,44 @@ def spherical_jnpp(n: int, z: float) -> float:
     return 1./z**2 * ((n**2-n-z**2)*spherical_jn(n, z) + 2.*z*spherical_jn(n+1, z))
 
 
+def _spherical_bessel_derivatives(func, n: int | np.ndarray,
+                                  z: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Spherical Bessel function and its first and second derivatives.
+
+    All three are calculated from the function values at orders `n` and `n+1`, which is quicker
+    than evaluating each of them separately.
+
+    Parameters
+    ----------
+    func :
+        The spherical Bessel function, either `scipy.special.spherical_jn` or
+        `scipy.special.spherical_yn`.
+    n :
+        Order (n ≥ 0). Can be an array of orders, in which case arrays of values are returned.
+    z :
+        Argument of the Bessel function.
+
+    Returns
+    -------
+    :
+        The values of the spherical Bessel function and its first and second derivatives.
+
+    Notes
+    -----
+    The first derivative is from the recurrence relation in [1] and the second derivative from
+    the differential equation in [2].
+
+    References
+    ----------
+    [1] <https://dlmf.nist.gov/10.51.E2>
+
+    [2] <https://dlmf.nist.gov/10.47.E1>
+    """
+    Z = func(n, z)
+    Z_next = func(n+1, z)
+    return Z, (n/z)*Z - Z_next, 1./z**2 * ((n**2-n-z**2)*Z + 2.*z*Z_next)
+
+
 def split_dict(d: dict, s: list) -> tuple[dict, dict]:
     """Split a dict into two dicts based on a list of keys.
 
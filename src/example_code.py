@@ -1,7 +1,9 @@
 # %%
 """Examples of using the echoSMs code to estimate scatter from objects."""
 
-import matplotlib.pyplot as plt
+import os
+from itertools import count
+import matplotlib
 import numpy as np
 import trimesh
 
@@ -14,6 +16,13 @@ from echosms import create_dwba_spheroid, create_dwba_cylinder
 from echosms import KRMdata
 from echosms import DWBAdata
 
+# Set the ECHOSMS_HEADLESS environment variable to save the figures to files instead of
+# showing them (useful when running this file as a benchmark or on a machine without a display).
+headless = bool(os.environ.get('ECHOSMS_HEADLESS'))
+if headless:
+    matplotlib.use('Agg')
+import matplotlib.pyplot as plt  # noqa: E402 (must come after choosing the backend)
+
 # Load the reference model defintiions
 rm = ReferenceModels()
 print('Available reference models are:\n')
@@ -22,6 +31,18 @@ print('\n'.join(rm.names()))
 # Load the benchmark data (from Jech et al., 2015)
 bm = BenchmarkData()
 
+figure_number = count(1)  # for naming the saved figures
+
+
+def show_figure(fig, name):
+    """Show a figure, or save it to a png file if running headless."""
+    if headless:
+        filename = f"fig_{next(figure_number):02d}_{name.replace(' ', '_')}.png"
+        fig.savefig(filename, dpi=100)
+        plt.close(fig)
+    else:
+        plt.show()
+
 
 def plot_compare_freq(f1, ts1, label1, f2, ts2, label2, title):
     """Plot together two ts(f) result sets."""
@@ -39,8 +60,8 @@ def plot_compare_freq(f1, ts1, label1, f2, ts2, label2, title):
     axs[1].set_ylabel(r'$\Delta$ TS [dB]')
     axs[1].annotate(f'{jech_index:.2f} dB', (0.05, 0.80), xycoords='axes fraction',
                     backgroundcolor=[.8, .8, .8])
-    plt.suptitle(title)
-    plt.show()
+    fig.suptitle(title)
+    show_figure(fig, title)
 
 
 def plot_compare_angle(theta1, ts1, label1, theta2, ts2, label2, title):
@@ -60,8 +81,8 @@ def plot_compare_angle(theta1, ts1, label1, theta2, ts2, label2, title):
     axs[1].set_ylabel(r'$\Delta$ TS [dB]')
     axs[1].annotate(f'{jech_index:.2f} dB', (0.05, 0.80), xycoords='axes fraction',
                     backgroundcolor=[.8, .8, .8])
-    plt.suptitle(name)
-    plt.show()
+    fig.suptitle(title)
+    show_figure(fig, title)
 
 
 # %% ###############################################################################################
@@ -293,9 +314,11 @@ dwba_ts = mod.calculate_ts(m)
 m |= {'phase_sd': 20, 'num_runs': 100}
 sdwba_ts = mod.calculate_ts(m, progress=True)
 
-plt.plot(m['theta'], sdwba_ts, label='sdwba')
-plt.plot(m['theta'], dwba_ts, label='dwba')
-plt.legend()
+fig, ax = plt.subplots()
+ax.plot(m['theta'], sdwba_ts, label='sdwba')
+ax.plot(m['theta'], dwba_ts, label='dwba')
+ax.legend()
+show_figure(fig, 'krill dwba and sdwba')
 
 # %% ###############################################################################################
 # Use the ES model on a calibration sphere
@@ -306,20 +329,22 @@ p['f'] = np.arange(10, 100, 0.05) * 1e3  # [kHz]
 es = ESModel()
 ts = es.calculate_ts(p, progress=True)
 
-plt.plot(p['f']*1e-3, ts)
-plt.xlabel('Freq [kHz]')
-plt.ylabel('TS re 1 m$^2$ [dB] ')
-plt.title(name)
-plt.show()
+fig, ax = plt.subplots()
+ax.plot(p['f']*1e-3, ts)
+ax.set_xlabel('Freq [kHz]')
+ax.set_ylabel('TS re 1 m$^2$ [dB] ')
+ax.set_title(name)
+show_figure(fig, name)
 
 # Can readily modify the parameters for a different sphere
 p['a'] = 0.012/2
 ts = es.calculate_ts(p)
-plt.plot(p['f']*1e-3, ts)
-plt.xlabel('Freq [kHz]')
-plt.ylabel('TS re 1 m$^2$ [dB] ')
-plt.title('WC12 calibration sphere')
-plt.show()
+fig, ax = plt.subplots()
+ax.plot(p['f']*1e-3, ts)
+ax.set_xlabel('Freq [kHz]')
+ax.set_ylabel('TS re 1 m$^2$ [dB] ')
+ax.set_title('WC12 calibration sphere')
+show_figure(fig, 'WC12 calibration sphere')
 
 # %% ###############################################################################################
 # Try the high-pass model
@@ -334,12 +359,14 @@ p['boundary_type'] = 'fluid filled'
 p |= {'medium_rho': 1024, 'target_c': 1510, 'target_rho': 1025}
 fluid = mod.calculate_ts(p)
 
-plt.semilogx(p['f']/1e3, fixed_rigid, label='fixed rigid')
-plt.semilogx(p['f']/1e3, elastic, label='elastic')
-plt.semilogx(p['f']/1e3, fluid, label='fluid filled')
-plt.legend()
-plt.xlabel('Frequency [kHz]')
-plt.ylabel('TS re 1m$2$ [dB]')
+fig, ax = plt.subplots()
+ax.semilogx(p['f']/1e3, fixed_rigid, label='fixed rigid')
+ax.semilogx(p['f']/1e3, elastic, label='elastic')
+ax.semilogx(p['f']/1e3, fluid, label='fluid filled')
+ax.legend()
+ax.set_xlabel('Frequency [kHz]')
+ax.set_ylabel('TS re 1m$2$ [dB]')
+show_figure(fig, 'high pass model')
 
 # %% ###############################################################################################
 # Try the KRM model and compare to the NOAA online KRM calculator results
@@ -351,12 +378,13 @@ for fname in fishes:
     fish = KRMdata().model(fname)
 
     # Plot the shapes
-    plt.plot(fish.body.x, fish.body.z_U, fish.body.x, fish.body.z_L, c='black')
+    fig, ax = plt.subplots()
+    ax.plot(fish.body.x, fish.body.z_U, fish.body.x, fish.body.z_L, c='black')
     for s in fish.inclusions:
-        plt.plot(s.x, s.z_U, s.x, s.z_L, c='C0' if s.boundary == 'fluid' else 'C1')
-    plt.gca().set_aspect('equal')
-    plt.title(fname)
-    plt.show()
+        ax.plot(s.x, s.z_U, s.x, s.z_L, c='C0' if s.boundary == 'fluid' else 'C1')
+    ax.set_aspect('equal')
+    ax.set_title(fname)
+    show_figure(fig, fname + ' shape')
 
     # Create the dict that echoSMs models use and add required parameters
     p = {'medium_c': 1490, 'medium_rho': 1030, 'organism': fish, 'theta': 90,
@@ -400,14 +428,15 @@ models_df['ts'] = ts
 # ts = mss.calculate_ts(models_df, multiprocess=True, result_type='expand')
 
 # plot some of the results
+fig, ax = plt.subplots()
 for rho in m['target_rho']:
     r = models_df.query('target_rho == @rho and theta==90')
-    plt.plot(r['f']/1e3, r['ts'], label=f'{rho:.0f}')
+    ax.plot(r['f']/1e3, r['ts'], label=f'{rho:.0f}')
 
-plt.xlabel('Freq [kHz]')
-plt.ylabel('TS re 1 m$^2$ [dB] ')
-plt.legend(title='Density [kg m$^{-3}$]')
-plt.show()
+ax.set_xlabel('Freq [kHz]')
+ax.set_ylabel('TS re 1 m$^2$ [dB] ')
+ax.legend(title='Density [kg m$^{-3}$]')
+show_figure(fig, 'weakly scattering sphere densities')
 
 # %% ###############################################################################################
 # Example of model parameters not from the benchmarks
@@ -433,7 +462,9 @@ print(f'Running {np.prod(params_xa.shape)} models!')
 mss.calculate_ts(params_xa, multiprocess=True, progress=False)
 
 # Xarray selections and dimenions names can then be used
-plt.plot(params_xa.f, params_xa.sel(theta=90, medium_rho=1000, medium_c=1600))
+fig, ax = plt.subplots()
+ax.plot(params_xa.f, params_xa.sel(theta=90, medium_rho=1000, medium_c=1600))
+show_figure(fig, 'fluid filled sphere xarray')
 
 # %% ###############################################################################################
 # Example of PT-DWBA model
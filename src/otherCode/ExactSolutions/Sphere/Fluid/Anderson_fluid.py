@@ -6,9 +6,62 @@ JASA, 22: 426-431, https://doi.org/10.1121/1.1906621
 import sys
 from pathlib import Path
 import numpy as np
-from scipy.special import spherical_jn, spherical_yn
 import matplotlib.pyplot as plt
 
+
+def sph_jn_all(nmax, x):
+    """Spherical Bessel functions of the first kind for orders 0 to nmax+1.
+
+    Uses Miller's downward recurrence, j_(n-1)(x) = (2n+1)/x*j_n(x) - j_(n+1)(x), as the
+    upward recurrence is unstable for orders larger than x. The recurrence is started above
+    nmax + x, with a margin that grows as x^(1/3) so that the results stay accurate for large x,
+    and the result is scaled to match j_0(x) or j_1(x), whichever is larger. The values grow
+    rapidly as the order decreases (especially for small x), so they are rescaled during the
+    recurrence whenever they get large enough to risk overflow.
+
+    Returns an array with shape (nmax+2, len(x)).
+    """
+    x_max = np.max(x)
+    n_start = nmax + 1 + int(x_max + 10*x_max**(1/3)) + 20
+    inv_x = 1.0/x  # each recurrence step then multiplies rather than divides
+    j = np.empty((nmax+2, x.size))
+    j_above = np.zeros_like(x)
+    j_n = np.full_like(x, 1e-30)
+    for n in range(n_start, 0, -1):
+        j_below = (2*n+1)*inv_x*j_n - j_above
+        if n-1 <= nmax+1:
+            j[n-1] = j_below
+        big = np.abs(j_below) > 1e250
+        if np.any(big):
+            scale = np.where(big, 1.0/np.abs(j_below), 1.0)
+            j_n = j_n*scale
+            j_below = j_below*scale
+            if n-1 <= nmax+1:
+                j[n-1:] *= scale  # the orders already calculated
+        j_above, j_n = j_n, j_below
+
+    j0 = np.sin(x)*inv_x
+    j1 = (j0 - np.cos(x))*inv_x
+    return j * np.where(np.abs(j0) >= np.abs(j1), j0/j[0], j1/j[1])
+
+
+def sph_yn_all(nmax, x):
+    """Spherical Bessel functions of the second kind for orders 0 to nmax+1.
+
+    Uses the upward recurrence, y_(n+1)(x) = (2n+1)/x*y_n(x) - y_(n-1)(x), which is stable
+    for the second kind.
+
+    Returns an array with shape (nmax+2, len(x)).
+    """
+    inv_x = 1.0/x  # each recurrence step then multiplies rather than divides
+    y = np.empty((nmax+2, x.size))
+    y[0] = -np.cos(x)*inv_x
+    y[1] = (y[0] - np.sin(x))*inv_x
+    for n in range(1, nmax+1):
+        y[n+1] = (2*n+1)*inv_x*y[n] - y[n-1]
+    return y
+
+
 ###
 # physical parameters of the sphere and surrounding water
 # from Jech et al. (2015)
@@ -68,47 +121,47 @@ if answ == 'n':
     sys.exit()
 
 ###
-# set up output variables
-# reflectivity coefficient
-refl = []
-# ka
-ka = []
-
-# real component
-real = 0.0
-# imaginary component
-imag = 0.0
+# ka for all frequencies (as arrays)
+# (the frequency independent 2*pi*a/c factors are calculated once)
+ka_sphere = (2*np.pi*a/c_sphere)*freq_Hz
+ka_water = (2*np.pi*a/c_water)*freq_Hz
+ka = ka_water
+
 ###
 # reflectivity coefficient
-# Bessel functions from SciPy
+# spherical Bessel functions for all orders and frequencies (rows are the orders, columns
+# the frequencies)
 # spherical Bessel function of the 2nd kind is the Neumann function
 # Anderson uses Neumann function notation
-for f in freq_Hz:
-    ka_sphere = (2*np.pi*f/c_sphere)*a
-    ka_water = (2*np.pi*f/c_water)*a
-    ka.append(ka_water)
-    for m in range(order_max):
-        sphjkas = (m/ka_sphere)*spherical_jn(m, ka_sphere)-spherical_jn(m+1, ka_sphere)
-        sphjkaw = (m/ka_water)*spherical_jn(m, ka_water)-spherical_jn(m+1, ka_water)
-        sphykas = (m/ka_sphere)*spherical_yn(m, ka_sphere)-spherical_yn(m+1, ka_sphere)
-        sphykaw = (m/ka_water)*spherical_yn(m, ka_water)-spherical_yn(m+1, ka_water)
-        alphaw = (2.*m+1.)*sphjkaw
-        alphas = (2.*m+1.)*sphjkas
-        beta = (2.*m+1)*sphykaw
-        numer = (alphas/alphaw)*(spherical_yn(m, ka_water)/spherical_jn(m, ka_sphere)) - \
-                ((beta/alphaw)*(g*h))
-        denom = (alphas/alphaw)*(spherical_jn(m, ka_water)/spherical_jn(m, ka_sphere))-(g*h)
-        cscat = numer/denom
-        real = real+((-1.)**m)*(2.*m+1)/(1.+cscat**2)
-        imag = imag+((-1.)**m)*(2.*m+1)*cscat/(1.+cscat**2)
-
-    refl.append((2/ka_water)*np.sqrt(real**2+imag**2))
-    imag = 0.0
-    real = 0.0
-
-# convert to numpy arrays
-refl = np.array(refl, dtype=float)
-ka = np.array(ka, dtype=float)
+J_s, Y_s = sph_jn_all(order_max, ka_sphere), sph_yn_all(order_max, ka_sphere)
+J_w, Y_w = sph_jn_all(order_max, ka_water), sph_yn_all(order_max, ka_water)
+
+# The terms for all orders and frequencies are calculated together as 2D arrays, with
+# rows being the orders (m) and columns the frequencies.
+m = np.arange(order_max)[:, np.newaxis]
+sign = np.where(m % 2, -1.0, 1.0)  # (-1)^m
+two_m_1 = 2.*m + 1.
+
+sphjkas = (m/ka_sphere)*J_s[:order_max]-J_s[1:order_max+1]
+sphjkaw = (m/ka_water)*J_w[:order_max]-J_w[1:order_max+1]
+sphykas = (m/ka_sphere)*Y_s[:order_max]-Y_s[1:order_max+1]
+sphykaw = (m/ka_water)*Y_w[:order_max]-Y_w[1:order_max+1]
+alphaw = two_m_1*sphjkaw
+alphas = two_m_1*sphjkas
+beta = two_m_1*sphykaw
+# numerator and denominator have both been multiplied through by alphaw
+numer = alphas*(Y_w[:order_max]/J_s[:order_max]) - beta*(g*h)
+denom = alphas*(J_w[:order_max]/J_s[:order_max]) - alphaw*(g*h)
+cscat = numer/denom
+
+# real and imaginary components, summed over the orders. cscat is real, so 1/(1+cscat^2)
+# is the real part of 1/(1 - i*cscat) and cscat/(1+cscat^2) the imaginary part.
+terms = sign*two_m_1/(1.+cscat*cscat)
+real = np.sum(terms, axis=0)
+imag = np.sum(terms*cscat, axis=0)
+
+# reflectivity coefficient
+refl = (2/ka_water)*np.hypot(real, imag)
 
 # convert to target strength (TS dB re m^2)
 # S is the cross-sectional area of the sphere
@@ -46,6 +46,11 @@ def test_test_instance(models):
         assert isinstance(m.analytical_type, str)
         assert m.max_ka > 0.0
 
+# Test that everything in the public API list exists.
+def test_public_api():
+    for name in echosms.__all__:
+        assert hasattr(echosms, name)
+
 # Test that reference model data is present.
 def test_reference_models(rm):
     assert len(rm.names()) > 0
@@ -67,6 +72,62 @@ def test_ts_results(rm):
     m['f'] = 38000
     assert np.allclose(mod.calculate_ts(m), [-44.9979], atol=0.0001)
 
+# Test that the DCM gives the benchmark TS, and the same TS for many parameters as it does one at
+# a time, with mixed boundary types and end-on incidence (where the DCM gives nan)
+def test_dcm_many_and_single(rm):
+    import pandas as pd
+    from echosms import DCMModel
+    from echosms.utils import as_dataframe
+    mod = DCMModel()
+    m1 = rm.parameters('fixed rigid finite cylinder')
+    m2 = rm.parameters('weakly scattering finite cylinder')
+
+    for m in [m1, m2]:
+        m['f'] = 38000.0
+        m['theta'] = [0.0, 30.0, 60.0, 90.0]
+    df = pd.concat([as_dataframe(m1), as_dataframe(m2)], ignore_index=True)
+    ts = mod.calculate_ts(df)
+    ts_single = [mod.calculate_ts_single(**r, validate_parameters=False)
+                 for r in df.to_dict('records')]
+    assert np.allclose(ts, ts_single, atol=1e-9, equal_nan=True)
+    assert np.allclose(ts, [np.nan, -62.81, -54.83, -33.62, np.nan, -112.28, -101.45, -84.80],
+                       atol=0.05, equal_nan=True)
+
+
+# Test that the ES model gives known TS values, and the same TS for many parameters as it does
+# one at a time when the number of series terms differs between them
+def test_es_many_and_single(rm):
+    from echosms import ESModel
+    mod = ESModel()
+    m = rm.parameters('WC38.1 calibration sphere')
+
+    m['a'] = [0.01, 0.0381/2]
+    m['f'] = [12000.0, 38000.0, 200000.0]
+    df = mod.calculate_ts(m, expand=True)
+    ts_single = [mod.calculate_ts_single(**r, validate_parameters=False)
+                 for r in df.drop(columns='ts').to_dict('records')]
+    assert np.allclose(df['ts'], ts_single, atol=1e-9)
+    assert np.allclose(df['ts'], [-55.0583, -49.9419, -44.9941, -41.8988, -42.3297, -39.4382],
+                       atol=0.0001)
+
+
+# Test that the DWBA gives the benchmark TS, and the same TS for many parameters as it does one
+# at a time
+def test_dwba_many_and_single(rm):
+    from echosms import DWBAModel, create_dwba_spheroid
+    mod = DWBAModel()
+    m = rm.parameters('weakly scattering prolate spheroid')
+
+    rv_pos, rv_tan, a = create_dwba_spheroid(m.pop('a'), m.pop('b'))
+    m.pop('boundary_type')
+    m |= {'theta': [2.0, 30.0, 60.0, 90.0], 'phi': 0.0, 'f': 38000.0,
+          'a': a, 'rv_pos': rv_pos, 'rv_tan': rv_tan}
+    df = mod.calculate_ts(m, expand=True)
+    ts_single = [mod.calculate_ts_single(**(r | df.attrs['parameters']), validate_parameters=False)
+                 for r in df.drop(columns='ts').to_dict('records')]
+    assert np.allclose(df['ts'], ts_single, atol=1e-9)
+    assert np.allclose(df['ts'], [-112.49, -111.62, -102.76, -77.17], atol=0.05)
+
 
 def test_missing_parameter(rm):
     from echosms import MSSModel
@@ -96,3 +157,51 @@ def test_unsupported_boundary_type(rm):
     m['boundary_type'] = ['elastic']
     with pytest.raises(ValueError):
         mod.calculate_ts(m)
+
+# Test that the DWBA copes with the incident wave being parallel to the body axis
+def test_dwba_end_on():
+    from echosms import DWBAModel, create_dwba_spheroid
+    rv_pos, rv_tan, a = create_dwba_spheroid(0.01, 0.002)
+    m = {'medium_c': 1500, 'medium_rho': 1000, 'target_c': 1510, 'target_rho': 1010,
+         'phi': 0, 'f': 38000, 'theta': [0.0, 0.001],
+         'a': a, 'rv_pos': rv_pos, 'rv_tan': rv_tan}
+    ts = DWBAModel().calculate_ts(m)
+    assert np.all(np.isfinite(ts))
+    assert np.isclose(ts[0], ts[1], atol=0.001)
+
+# Test that the DWBA incident direction matches the echoSMs rotation convention
+def test_dwba_incident_direction():
+    from scipy.spatial.transform import Rotation as R
+    from echosms.dwbamodel import _incidence
+    geometry = (None, np.eye(3), np.eye(3), None)
+    for theta, phi in [(90, 0), (0, 0), (45, 30), (170, -60), (300, 200)]:
+        k_hat_i = R.from_euler('ZYX', (0, theta-90, -phi), degrees=True).apply([0, 0, 1])
+        pos_proj, _ = _incidence(theta, phi, geometry)
+        assert np.allclose(pos_proj[0], k_hat_i, atol=1e-12)
+
+# Test that SDWBA results are reproducible with a seeded random number generator
+def test_sdwba_seed():
+    from echosms import DWBAModel, create_dwba_spheroid
+    rv_pos, rv_tan, a = create_dwba_spheroid(0.01, 0.002)
+    m = {'medium_c': 1500, 'medium_rho': 1000, 'target_c': 1510, 'target_rho': 1010,
+         'phi': 0, 'f': 120000, 'theta': [45.0, 90.0], 'phase_sd': 20, 'num_runs': 10,
+         'a': a, 'rv_pos': rv_pos, 'rv_tan': rv_tan}
+    ts1 = DWBAModel(rng=42).calculate_ts(m)
+    ts2 = DWBAModel(rng=42).calculate_ts(m)
+    ts3 = DWBAModel(rng=43).calculate_ts(m)
+    assert ts1 == ts2
+    assert not np.allclose(ts1, ts3)
+
+# Test that the DWBA rejects rv_tan vectors that are not of unit length
+def test_dwba_rv_tan_not_unit():
+    from echosms import DWBAModel, create_dwba_spheroid
+    rv_pos, rv_tan, a = create_dwba_spheroid(0.01, 0.002)
+    m = {'medium_c': 1500, 'medium_rho': 1000, 'target_c': 1510, 'target_rho': 1010,
+         'phi': 0, 'f': 38000, 'theta': 90, 'a': a, 'rv_pos': rv_pos, 'rv_tan': rv_tan}
+    mod = DWBAModel()
+    mod.calculate_ts(m | {'rv_tan': rv_tan*(1.0 + 1e-10)})
+
+    rv_tan = rv_tan.copy()
+    rv_tan[3] *= 1.0 + 1e-6
+    with pytest.raises(ValueError, match='All vectors in rv_tan must be of unit length.'):
+        mod.calculate_ts(m | {'rv_tan': rv_tan})